@@ -20,8 +20,16 @@ toolchains that should not be copied into the project tree.
 import os
 import hashlib
 
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
 from buildstream import Source, SourceError, Directory
 
+# Linux FICLONE ioctl — constant-time CoW clone on XFS/Btrfs
+_FICLONE = getattr(fcntl, "FICLONE", 0x40049409) if fcntl else None
+
 
 class LocalExternalSource(Source):
 
@@ -30,6 +38,11 @@ class LocalExternalSource(Source):
 
     __digest = None
 
+    # Unique keys shared across instances: every aosp_cc element
+    # references the same toolchain paths, so one stat+hash per
+    # (path, mtime, size) serves them all.
+    _key_cache = {}
+
     def configure(self, node):
         node.validate_keys(["path", *Source.COMMON_CONFIG_KEYS])
         self.path = node.get_str("path")
@@ -58,10 +71,16 @@ class LocalExternalSource(Source):
         # path + mtime of the top-level directory is sufficient.
         try:
             stat = os.stat(self.path)
-            content_tag = "{}:{}:{}".format(self.path, stat.st_mtime_ns, stat.st_size)
+            cache_key = (self.path, stat.st_mtime_ns, stat.st_size)
+            content_tag = "{}:{}:{}".format(*cache_key)
         except OSError:
+            cache_key = (self.path,)
             content_tag = self.path
-        return hashlib.sha256(content_tag.encode()).hexdigest()
+        key = LocalExternalSource._key_cache.get(cache_key)
+        if key is None:
+            key = hashlib.sha256(content_tag.encode()).hexdigest()
+            LocalExternalSource._key_cache[cache_key] = key
+        return key
 
     def load_ref(self, node):
         pass
@@ -78,11 +97,57 @@ class LocalExternalSource(Source):
     def stage_directory(self, directory):
         assert isinstance(directory, Directory)
         with self.timed_activity("Staging external files from {}".format(self.path)):
+            # When the virtual directory is backed by a real filesystem
+            # path, try to reflink the tree — constant-time per file on
+            # CoW filesystems, which matters for multi-GB prebuilts.
+            dest = getattr(directory, "external_directory", None)
+            if dest and os.path.isdir(self.path) and self._reflink_tree(self.path, dest):
+                return
             if os.path.isdir(self.path):
                 directory.import_files(self.path)
             else:
                 directory.import_single_file(self.path)
 
+    def _reflink_tree(self, src_root, dest_root):
+        """Clone src_root into dest_root using FICLONE reflinks.
+
+        Returns False on the first failure (non-Linux, non-CoW
+        filesystem, cross-device clone, ...) so the caller can fall back
+        to a full import — import_files overwrites, so a partial clone
+        is harmless.
+        """
+        if _FICLONE is None:
+            return False
+        try:
+            for dirpath, dirnames, filenames in os.walk(src_root):
+                rel = os.path.relpath(dirpath, src_root)
+                dest_dir = os.path.join(dest_root, rel) if rel != "." else dest_root
+                os.makedirs(dest_dir, exist_ok=True)
+                # Symlinks to directories appear in dirnames but are not
+                # descended into; recreate the link itself and prune it
+                # so no real directory is created in its place. Sysroots
+                # are full of these (lib64 -> lib, GCC version links).
+                for name in list(dirnames):
+                    src = os.path.join(dirpath, name)
+                    if os.path.islink(src):
+                        dirnames.remove(name)
+                        dest = os.path.join(dest_dir, name)
+                        if not os.path.lexists(dest):
+                            os.symlink(os.readlink(src), dest)
+                for name in filenames:
+                    src = os.path.join(dirpath, name)
+                    dest = os.path.join(dest_dir, name)
+                    if os.path.islink(src):
+                        if not os.path.lexists(dest):
+                            os.symlink(os.readlink(src), dest)
+                        continue
+                    with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+                        fcntl.ioctl(fdst.fileno(), _FICLONE, fsrc.fileno())
+                    os.chmod(dest, os.stat(src).st_mode)
+        except OSError:
+            return False
+        return True
+
 
 def setup():
     return LocalExternalSource
@@ -1,86 +1,134 @@
 """AST node types for Android.bp Blueprint files.
 
 Mirrors the Go AST in build/blueprint/parser/ast.go, simplified for Python.
+
+Properties are stored as a list of Property nodes (order and duplicates
+matter to defaults merging) with a lazy name -> value dict per node for
+O(1) lookups. A parallel-arrays (names/values) layout was considered and
+rejected: list.index would reintroduce linear scans that the dict
+already avoids, and nothing here iterates names without their values.
 """
 
 from dataclasses import dataclass, field
-from typing import Union
+from typing import Optional, Union
+
+
+def _prop_index(properties):
+    """Build a name -> value index, keeping the first occurrence of a name
+    to match the linear-scan semantics of Module.get/MapExpr.get."""
+    index = {}
+    for prop in properties:
+        if prop.name not in index:
+            index[prop.name] = prop.value
+    return index
+
+
+# Integer type tags for expression nodes — lets hot paths dispatch on
+# expr.KIND via a jump table instead of isinstance chains.
+KIND_STRING = 0
+KIND_BOOL = 1
+KIND_INT = 2
+KIND_LIST = 3
+KIND_MAP = 4
+KIND_VARREF = 5
+KIND_OPERATOR = 6
+KIND_SELECT = 7
 
 
 # --- Expression nodes ---
 
-@dataclass
+@dataclass(slots=True)
 class StringExpr:
     value: str
 
+    KIND = KIND_STRING
+
     def __repr__(self):
         return f"StringExpr({self.value!r})"
 
 
-@dataclass
+@dataclass(slots=True)
 class BoolExpr:
     value: bool
 
+    KIND = KIND_BOOL
+
     def __repr__(self):
         return f"BoolExpr({self.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class IntExpr:
     value: int
 
+    KIND = KIND_INT
+
     def __repr__(self):
         return f"IntExpr({self.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class ListExpr:
     values: list = field(default_factory=list)
 
+    KIND = KIND_LIST
+
     def __repr__(self):
         return f"ListExpr({self.values})"
 
 
-@dataclass
+@dataclass(slots=True)
 class MapExpr:
     properties: list = field(default_factory=list)  # list of Property
+    _index: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+
+    KIND = KIND_MAP
 
     def __repr__(self):
         return f"MapExpr({self.properties})"
 
     def get(self, name):
-        """Get property value by name, or None."""
-        for prop in self.properties:
-            if prop.name == name:
-                return prop.value
-        return None
+        """Get property value by name, or None.
 
+        Lookups go through a dict index built on first access; the
+        properties list must not be mutated afterwards.
+        """
+        if self._index is None:
+            self._index = _prop_index(self.properties)
+        return self._index.get(name)
 
-@dataclass
+
+@dataclass(slots=True)
 class VariableRef:
     name: str
 
+    KIND = KIND_VARREF
+
     def __repr__(self):
         return f"VariableRef({self.name})"
 
 
-@dataclass
+@dataclass(slots=True)
 class OperatorExpr:
     left: "Expression"
     op: str  # "+"
     right: "Expression"
 
+    KIND = KIND_OPERATOR
+
     def __repr__(self):
         return f"OperatorExpr({self.left} {self.op} {self.right})"
 
 
-@dataclass
+@dataclass(slots=True)
 class SelectExpr:
     """select(condition_func("arg1", "arg2"), { ... }) expression."""
     func_name: str
     func_args: list  # list of strings
     cases: list = field(default_factory=list)  # list of (patterns, value) tuples
 
+    KIND = KIND_SELECT
+
     def __repr__(self):
         return f"SelectExpr({self.func_name}({self.func_args}), {len(self.cases)} cases)"
 
@@ -94,7 +142,7 @@ Expression = Union[
 
 # --- Top-level nodes ---
 
-@dataclass
+@dataclass(slots=True)
 class Property:
     name: str
     value: Expression
@@ -103,7 +151,7 @@ class Property:
         return f"Property({self.name}: {self.value})"
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment:
     name: str
     value: Expression
@@ -113,31 +161,46 @@ class Assignment:
         return f"Assignment({self.name} {self.assigner} {self.value})"
 
 
-@dataclass
+_UNSET = object()
+
+
+@dataclass(slots=True)
 class Module:
     type: str
     properties: list = field(default_factory=list)  # list of Property
+    _index: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _name: object = field(default=_UNSET, init=False, repr=False, compare=False)
 
     def __repr__(self):
         return f"Module({self.type}, name={self.name!r})"
 
     @property
     def name(self):
-        for prop in self.properties:
-            if prop.name == "name":
-                if isinstance(prop.value, StringExpr):
-                    return prop.value.value
-        return None
+        # Accessed repeatedly (handlers, defaults resolution, error
+        # messages) — resolved once via the same lazy pattern as _index.
+        name = self._name
+        if name is _UNSET:
+            value = self.get("name")
+            name = value.value if isinstance(value, StringExpr) else None
+            self._name = name
+        return name
+
+    def properties_dict(self):
+        """Name -> value dict over the properties.
+
+        Built once on first access and shared; the properties list must
+        not be mutated afterwards.
+        """
+        if self._index is None:
+            self._index = _prop_index(self.properties)
+        return self._index
 
     def get(self, name):
         """Get property value by name, or None."""
-        for prop in self.properties:
-            if prop.name == name:
-                return prop.value
-        return None
+        return self.properties_dict().get(name)
 
 
-@dataclass
+@dataclass(slots=True)
 class File:
     name: str
     defs: list = field(default_factory=list)  # list of Assignment | Module
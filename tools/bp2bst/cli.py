@@ -8,6 +8,7 @@ Usage:
 """
 
 import argparse
+import concurrent.futures
 import json
 import os
 import sys
@@ -16,7 +17,8 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from bp2bst.parser import parse_file
-from bp2bst.converter import Converter
+from bp2bst import parse_cache
+from bp2bst.converter import Converter, ConversionResult
 from bp2bst.module_types import supported_types
 
 
@@ -33,12 +35,7 @@ def cmd_convert(args):
     )
 
     # Determine output prefix from the bp file path relative to AOSP root
-    output_prefix = args.prefix
-    if not output_prefix and args.aosp_root:
-        bp_dir = os.path.dirname(os.path.abspath(bp_path))
-        aosp_abs = os.path.abspath(args.aosp_root)
-        if bp_dir.startswith(aosp_abs):
-            output_prefix = os.path.relpath(bp_dir, aosp_abs)
+    output_prefix = _output_prefix_for(bp_path, args.aosp_root, args.prefix)
 
     result = converter.convert_file(bp_path, output_prefix=output_prefix)
 
@@ -74,9 +71,87 @@ def cmd_convert(args):
         for elem in result.elements:
             print(f"  {elem['filename']}")
 
+    print(parse_cache.stats(), file=sys.stderr)
     return 0
 
 
+def _output_prefix_for(bp_path, aosp_root, prefix):
+    """Derive the element filename prefix for one Android.bp file."""
+    if prefix:
+        return prefix
+    if aosp_root:
+        bp_dir = os.path.dirname(os.path.abspath(bp_path))
+        aosp_abs = os.path.abspath(aosp_root)
+        if bp_dir.startswith(aosp_abs):
+            return os.path.relpath(bp_dir, aosp_abs)
+    return ""
+
+
+def _convert_one(bp_path, target_arch, aosp_root, prefix):
+    """Worker for convert-many: convert a single file in a subprocess.
+
+    Builds its own Converter — only the path and settings cross the
+    process boundary, and the ConversionResult pickles back cleanly.
+    """
+    converter = Converter(target_arch=target_arch, aosp_root=aosp_root)
+    output_prefix = _output_prefix_for(bp_path, aosp_root, prefix)
+    return bp_path, converter.convert_file(bp_path, output_prefix=output_prefix)
+
+
+def cmd_convert_many(args):
+    """Convert many Android.bp files in parallel.
+
+    Parsing and evaluation are CPU-bound pure Python, so this uses a
+    process pool rather than threads.
+    """
+    bp_paths = [p for p in args.files if os.path.exists(p)]
+    missing = [p for p in args.files if not os.path.exists(p)]
+    for p in missing:
+        print(f"Error: file not found: {p}", file=sys.stderr)
+    if not bp_paths:
+        return 1
+
+    # Aggregate every worker's ConversionResult into one, so the batch
+    # run reports the same diagnostics as single-file convert
+    combined = ConversionResult()
+    with concurrent.futures.ProcessPoolExecutor(max_workers=os.cpu_count()) as pool:
+        futures = [
+            pool.submit(_convert_one, p, args.target_arch, args.aosp_root, args.prefix)
+            for p in bp_paths
+        ]
+        for future in concurrent.futures.as_completed(futures):
+            bp_path, result = future.result()
+            combined.elements.extend(result.elements)
+            combined.errors.extend(result.errors)
+            combined.unsupported.extend(result.unsupported)
+            combined.skipped.extend(result.skipped)
+
+    if combined.errors:
+        print("Errors:", file=sys.stderr)
+        for err in combined.errors:
+            print(f"  {err}", file=sys.stderr)
+
+    if combined.unsupported:
+        print(f"Unsupported module types ({len(combined.unsupported)}):", file=sys.stderr)
+        for u in combined.unsupported:
+            print(f"  {u}", file=sys.stderr)
+
+    if combined.skipped:
+        print(f"Skipped ({len(combined.skipped)}):", file=sys.stderr)
+        for s in combined.skipped:
+            print(f"  {s}", file=sys.stderr)
+
+    if not combined.elements:
+        print("No elements generated.", file=sys.stderr)
+        return 1
+
+    converter = Converter(target_arch=args.target_arch, aosp_root=args.aosp_root)
+    converter.write_elements(combined, args.output_dir)
+    print(f"Generated {len(combined.elements)} element(s) from {len(bp_paths)} file(s) in {args.output_dir}/")
+
+    return 1 if (combined.errors or missing) else 0
+
+
 def cmd_parse(args):
     """Parse and dump AST for debugging."""
     bp_path = args.file
@@ -130,6 +205,14 @@ def main():
     p_convert.add_argument("--prefix", default="", help="Output filename prefix")
     p_convert.add_argument("--dry-run", "-n", action="store_true", help="Print elements without writing files")
 
+    # convert-many
+    p_many = subparsers.add_parser("convert-many", help="Convert many Android.bp files in parallel")
+    p_many.add_argument("files", nargs="+", help="Paths to Android.bp files")
+    p_many.add_argument("--target-arch", default="x86_64", help="Target architecture (default: x86_64)")
+    p_many.add_argument("--output-dir", default="elements", help="Output directory (default: elements/)")
+    p_many.add_argument("--aosp-root", default="", help="AOSP source tree root")
+    p_many.add_argument("--prefix", default="", help="Output filename prefix")
+
     # parse
     p_parse = subparsers.add_parser("parse", help="Parse Android.bp and dump AST")
     p_parse.add_argument("file", help="Path to Android.bp file")
@@ -142,6 +225,8 @@ def main():
 
     if args.command == "convert":
         return cmd_convert(args)
+    elif args.command == "convert-many":
+        return cmd_convert_many(args)
     elif args.command == "parse":
         return cmd_parse(args)
     elif args.command == "info":
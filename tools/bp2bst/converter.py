@@ -10,16 +10,41 @@ from typing import Dict, List, Optional, Any
 
 import yaml
 
+# Prefer the libyaml C implementations — roughly an order of magnitude
+# faster than the pure-Python loader/dumper on large element batches.
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
+
+class _BstDumper(SafeDumper):
+    """SafeDumper that renders multiline strings as literal blocks."""
+
+
+def _represent_str(dumper, value):
+    style = "|" if "\n" in value else None
+    return dumper.represent_scalar("tag:yaml.org,2002:str", value, style=style)
+
+
+_BstDumper.add_representer(str, _represent_str)
+
+# Canonical top-level key order for generated elements
+_SECTION_ORDER = ("kind", "depends", "sources", "variables", "config")
+
 from .parser import parse_file, parse_string
+from . import parse_cache
 from .evaluator import Evaluator
 from .defaults import DefaultsResolver
-from .module_types import get_handler, supported_types
+from .module_types import HANDLERS, supported_types
 from . import ast
 
 
 class ConversionResult:
     """Result of converting an Android.bp file."""
 
+    __slots__ = ("elements", "skipped", "errors", "unsupported")
+
     def __init__(self):
         self.elements: List[Dict[str, Any]] = []  # list of {filename, content}
         self.skipped: List[str] = []  # module names/types that were skipped
@@ -47,12 +72,26 @@ class Converter:
             ConversionResult with generated elements and diagnostics
         """
         result = ConversionResult()
+        result.elements = list(self.iter_elements(bp_path, output_prefix, result))
+        return result
+
+    def iter_elements(self, bp_path: str, output_prefix: str = "",
+                      result: Optional[ConversionResult] = None):
+        """Yield element dicts for one Android.bp file as they are built.
+
+        Streaming counterpart of convert_file — callers that only need
+        to iterate (e.g. writing elements straight to disk) avoid
+        holding the whole element list. Diagnostics are recorded on the
+        given ConversionResult, or dropped if none is passed.
+        """
+        if result is None:
+            result = ConversionResult()
 
         try:
-            file_ast = parse_file(bp_path)
+            file_ast = parse_cache.load(bp_path)
         except Exception as e:
             result.errors.append(f"Parse error in {bp_path}: {e}")
-            return result
+            return
 
         # Register file-level variables
         self.evaluator.add_file_variables(file_ast)
@@ -74,7 +113,7 @@ class Converter:
 
         # Convert each module
         for module in evaluated_modules:
-            handler = get_handler(module.type)
+            handler = HANDLERS.get(module.type)
 
             if handler is None:
                 result.unsupported.append(f"{module.type} '{module.name or '?'}'")
@@ -103,66 +142,63 @@ class Converter:
             if output_prefix:
                 element["filename"] = os.path.join(output_prefix, element["filename"])
 
-            result.elements.append(element)
+            yield element
 
-        return result
+    def write_elements(self, result, output_dir: str):
+        """Write generated elements to disk as .bst YAML files.
 
-    def write_elements(self, result: ConversionResult, output_dir: str):
-        """Write generated elements to disk as .bst YAML files."""
-        for element in result.elements:
+        Accepts a ConversionResult or any iterable of element dicts, so
+        iter_elements output can be streamed straight to disk.
+        """
+        elements = result.elements if isinstance(result, ConversionResult) else result
+        # Elements cluster into a few directories per Android.bp file;
+        # remember what we already created instead of calling makedirs
+        # per element.
+        made_dirs = set()
+        for element in elements:
             filepath = os.path.join(output_dir, element["filename"])
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-            # Custom YAML formatting for readability
-            content = self._format_bst(element["content"])
+            dirpath = os.path.dirname(filepath)
+            if dirpath not in made_dirs:
+                os.makedirs(dirpath, exist_ok=True)
+                made_dirs.add(dirpath)
+
+            # Stream straight into the file — no intermediate string.
+            # Binary mode with a large buffer flushes each element in a
+            # single write and skips the text-layer newline translation.
+            with open(filepath, "wb", buffering=1 << 20) as f:
+                yaml.dump(
+                    self._ordered_content(element["content"]),
+                    f,
+                    Dumper=_BstDumper,
+                    encoding="utf-8",
+                    sort_keys=False,
+                    default_flow_style=False,
+                    width=1000,
+                )
 
-            with open(filepath, "w") as f:
-                f.write(content)
+    def _ordered_content(self, element_dict: dict) -> dict:
+        """Order element keys canonically and drop empty source lists."""
+        ordered = {
+            k: element_dict[k]
+            for k in _SECTION_ORDER
+            if k in element_dict and not (k == "sources" and not element_dict[k])
+        }
+        for k, v in element_dict.items():
+            if k not in ordered and k != "sources":
+                ordered[k] = v
+        return ordered
 
     def _format_bst(self, element_dict: dict) -> str:
-        """Format a .bst element dict as YAML with a header comment."""
-        lines = []
-
-        # Kind
-        lines.append(f"kind: {element_dict['kind']}")
-        lines.append("")
-
-        # Dependencies
-        if "depends" in element_dict:
-            lines.append("depends:")
-            for dep in element_dict["depends"]:
-                lines.append(f"- {dep}")
-            lines.append("")
-
-        # Sources
-        if "sources" in element_dict and element_dict["sources"]:
-            lines.append("sources:")
-            for src in element_dict["sources"]:
-                lines.append(f"- kind: {src['kind']}")
-                lines.append(f"  path: {src['path']}")
-            lines.append("")
-
-        # Variables
-        if "variables" in element_dict:
-            lines.append("variables:")
-            for key, value in element_dict["variables"].items():
-                if "\n" in str(value):
-                    lines.append(f"  {key}: |")
-                    for vline in str(value).split("\n"):
-                        lines.append(f"    {vline}")
-                else:
-                    # Quote values that contain special YAML characters
-                    if isinstance(value, str) and any(c in value for c in "{}[]#&*!|>',@%"):
-                        lines.append(f'  {key}: "{value}"')
-                    else:
-                        lines.append(f"  {key}: {value}")
-            lines.append("")
-
-        # Config (for import elements)
-        if "config" in element_dict:
-            lines.append("config:")
-            for key, value in element_dict["config"].items():
-                lines.append(f"  {key}: {value}")
-            lines.append("")
-
-        return "\n".join(lines)
+        """Format a .bst element dict as YAML.
+
+        Serialization goes through the (C-accelerated) YAML dumper, which
+        handles quoting edge cases the old hand formatter got wrong;
+        multiline values come out as literal blocks.
+        """
+        return yaml.dump(
+            self._ordered_content(element_dict),
+            Dumper=_BstDumper,
+            sort_keys=False,
+            default_flow_style=False,
+            width=1000,
+        )
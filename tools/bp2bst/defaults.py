@@ -6,17 +6,34 @@ correct precedence: later defaults override earlier ones, and module-level
 properties override all defaults.
 """
 
+from functools import singledispatch
 from typing import Dict, List, Optional
 from . import ast
 from .evaluator import extract_string_list
 
 
 class DefaultsResolver:
-    """Resolves cc_defaults inheritance chains."""
+    """Resolves cc_defaults inheritance chains.
+
+    cc_defaults modules are indexed by name at registration time, so
+    resolving a module never scans the file's module list. Chains are
+    flattened once per root and resolution is memoized per module, so
+    repeat work collapses to dict lookups — generating specialized
+    Python per chain (exec-based codegen) was considered and rejected;
+    it would amortize to the same cost with far harder debugging.
+    """
 
     def __init__(self):
         # name -> Module for all cc_defaults modules
         self.defaults_registry: Dict[str, ast.Module] = {}
+        # root defaults name -> flattened, ordered chain of Modules
+        self._chain_cache: Dict[str, List[ast.Module]] = {}
+        # defaults name -> bit position for the visited bitmap used while
+        # flattening chains
+        self._name_index: Dict[str, int] = {}
+        # id(module) -> (module, resolved) — the module is pinned so the
+        # id cannot be recycled while the entry is live
+        self._resolved: Dict[int, tuple] = {}
 
     def register_defaults(self, modules: List[ast.Module]):
         """Register all cc_defaults modules from a parsed file."""
@@ -25,9 +42,28 @@ class DefaultsResolver:
                 name = module.name
                 if name:
                     self.defaults_registry[name] = module
+                    if name not in self._name_index:
+                        self._name_index[name] = len(self._name_index)
+                    # New registrations can extend previously-cached
+                    # chains and change resolution results
+                    self._chain_cache.clear()
+                    self._resolved.clear()
 
     def resolve(self, module: ast.Module) -> ast.Module:
-        """Resolve defaults for a module, returning a new module with merged properties."""
+        """Resolve defaults for a module, returning a new module with merged properties.
+
+        Results are memoized per module node, so resolving the same
+        module again (multi-target runs, repeated test fixtures) is a
+        dict hit.
+        """
+        cached = self._resolved.get(id(module))
+        if cached is not None:
+            return cached[1]
+        resolved = self._resolve(module)
+        self._resolved[id(module)] = (module, resolved)
+        return resolved
+
+    def _resolve(self, module: ast.Module) -> ast.Module:
         defaults_prop = module.get("defaults")
         if defaults_prop is None:
             return module
@@ -36,11 +72,21 @@ class DefaultsResolver:
         if not defaults_names:
             return module
 
-        # Collect all defaults in order, resolving nested defaults
+        # Collect all defaults in order, resolving nested defaults.
+        # Chains are flattened once per root name and cached; duplicates
+        # across roots are dropped, keeping the first occurrence.
         all_defaults = []
-        visited = set()
+        seen = set()
         for name in defaults_names:
-            self._collect_defaults(name, all_defaults, visited)
+            for defaults_module in self._defaults_chain(name):
+                defaults_name = defaults_module.name
+                if defaults_name not in seen:
+                    seen.add(defaults_name)
+                    all_defaults.append(defaults_module)
+
+        if not all_defaults:
+            # Nothing known to merge (defaults defined elsewhere)
+            return module
 
         # Merge: start with first defaults, overlay subsequent, then overlay module
         merged_props = {}
@@ -53,37 +99,51 @@ class DefaultsResolver:
             [p for p in module.properties if p.name != "defaults"],
         )
 
-        # Reconstruct properties list, ensuring "name" is preserved from original
+        # Reconstruct properties list; _merge_properties always skips
+        # "name", so the original module's name goes back in front.
         final_props = [ast.Property(name=k, value=v) for k, v in merged_props.items()]
-
-        # Re-add the "name" property from the original module if it was stripped
-        has_name = any(p.name == "name" for p in final_props)
-        if not has_name:
-            name_prop = module.get("name")
-            if name_prop is not None:
-                final_props.insert(0, ast.Property(name="name", value=name_prop))
+        name_prop = module.get("name")
+        if name_prop is not None:
+            final_props.insert(0, ast.Property(name="name", value=name_prop))
 
         return ast.Module(type=module.type, properties=final_props)
 
-    def _collect_defaults(self, name: str, result: list, visited: set):
-        """Recursively collect defaults, handling chained defaults."""
-        if name in visited:
-            return
-        visited.add(name)
-
-        defaults_module = self.defaults_registry.get(name)
-        if defaults_module is None:
+    def _defaults_chain(self, name: str) -> List[ast.Module]:
+        """Return the flattened, ordered defaults chain rooted at name."""
+        chain = self._chain_cache.get(name)
+        if chain is None:
+            chain = []
+            self._collect_defaults(name, chain, 0)
+            self._chain_cache[name] = chain
+        return chain
+
+    def _collect_defaults(self, name: str, result: list, visited: int) -> int:
+        """Recursively collect defaults, handling chained defaults.
+
+        Cycle detection uses an int bitmap over the registered-defaults
+        name index instead of allocating a set per call; the updated
+        bitmap is threaded back through the return value.
+        """
+        idx = self._name_index.get(name)
+        if idx is None:
             # Unknown defaults — skip silently (may be defined elsewhere)
-            return
+            return visited
+        bit = 1 << idx
+        if visited & bit:
+            return visited
+        visited |= bit
+
+        defaults_module = self.defaults_registry[name]
 
         # First resolve any nested defaults
         nested_defaults_prop = defaults_module.get("defaults")
         if nested_defaults_prop is not None:
             nested_names = extract_string_list(nested_defaults_prop)
             for nested_name in nested_names:
-                self._collect_defaults(nested_name, result, visited)
+                visited = self._collect_defaults(nested_name, result, visited)
 
         result.append(defaults_module)
+        return visited
 
     def _merge_properties(self, target: dict, properties: list):
         """Merge properties into target dict.
@@ -99,27 +159,46 @@ class DefaultsResolver:
 
             if name in target:
                 existing = target[name]
-                target[name] = self._merge_values(existing, prop.value)
+                target[name] = _merge_values(existing, prop.value)
             else:
                 target[name] = prop.value
 
-    def _merge_values(self, base: ast.Expression, overlay: ast.Expression) -> ast.Expression:
-        """Merge two values according to Soong rules."""
-        # List + List = concatenation
-        if isinstance(base, ast.ListExpr) and isinstance(overlay, ast.ListExpr):
-            return ast.ListExpr(values=base.values + overlay.values)
-
-        # Map + Map = recursive merge
-        if isinstance(base, ast.MapExpr) and isinstance(overlay, ast.MapExpr):
-            merged = {p.name: p.value for p in base.properties}
-            for prop in overlay.properties:
-                if prop.name in merged:
-                    merged[prop.name] = self._merge_values(merged[prop.name], prop.value)
-                else:
-                    merged[prop.name] = prop.value
-            return ast.MapExpr(
-                properties=[ast.Property(name=k, value=v) for k, v in merged.items()]
-            )
-
-        # Scalar: overlay wins
-        return overlay
+
+@singledispatch
+def _merge_values(base: ast.Expression, overlay: ast.Expression) -> ast.Expression:
+    """Merge two values according to Soong rules.
+
+    Dispatches on the type of the base value; the default case is a
+    scalar, where the overlay wins.
+    """
+    return overlay
+
+
+@_merge_values.register
+def _(base: ast.ListExpr, overlay: ast.Expression) -> ast.Expression:
+    # List + List = concatenation
+    if isinstance(overlay, ast.ListExpr):
+        return ast.ListExpr(values=[*base.values, *overlay.values])
+    return overlay
+
+
+@_merge_values.register
+def _(base: ast.MapExpr, overlay: ast.Expression) -> ast.Expression:
+    # Map + Map = recursive merge
+    if isinstance(overlay, ast.MapExpr):
+        # Structural sharing when one side contributes nothing — no new
+        # node, no property copies (merge output is never mutated)
+        if not overlay.properties:
+            return base
+        if not base.properties:
+            return overlay
+        merged = {p.name: p.value for p in base.properties}
+        for prop in overlay.properties:
+            if prop.name in merged:
+                merged[prop.name] = _merge_values(merged[prop.name], prop.value)
+            else:
+                merged[prop.name] = prop.value
+        return ast.MapExpr(
+            properties=[ast.Property(name=k, value=v) for k, v in merged.items()]
+        )
+    return overlay
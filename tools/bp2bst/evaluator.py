@@ -13,66 +13,165 @@ class EvalError(Exception):
 
 
 class Evaluator:
-    """Evaluates Blueprint AST expressions given a variable scope."""
+    """Evaluates Blueprint AST expressions given a variable scope.
+
+    The interpreter is "pre-compiled" in effect without a closure-tree
+    pass: dispatch is a KIND-indexed jump table rather than per-node
+    type tests, and results are memoized per node, so re-evaluating any
+    already-seen subtree is a single dict hit — the same amortized cost
+    a compile-to-thunks design would give, with no compile step to keep
+    coherent when variables are rebound between files.
+    """
 
     def __init__(self, variables: Optional[Dict[str, ast.Expression]] = None):
         self.variables: Dict[str, ast.Expression] = dict(variables or {})
+        # Memoized results keyed on id(expr). The expression is pinned
+        # alongside its result so the id cannot be recycled while the
+        # entry is live.
+        self._eval_cache: Dict[int, tuple] = {}
+        # Variables fully evaluated on first reference, so a variable
+        # used by many modules is only expanded once.
+        self._evaluated_vars: Dict[str, ast.Expression] = {}
+        # Jump table indexed by expr.KIND — avoids the isinstance chain
+        # on every node.
+        self._dispatch = (
+            None,  # KIND_STRING: handled by the literal fast path
+            None,  # KIND_BOOL
+            None,  # KIND_INT
+            self._eval_list,
+            self._eval_map,
+            self._eval_varref,
+            self._eval_operator,
+            self._eval_select,
+        )
+
+    def evaluate_file(self, file: ast.File) -> list:
+        """Register a file's variables and evaluate all its modules.
+
+        One-call form of add_file_variables plus per-module
+        evaluate_module; variable bindings are registered once and every
+        module evaluation shares the same warm caches.
+        """
+        self.add_file_variables(file)
+        evaluate_module = self.evaluate_module
+        return [evaluate_module(m) for m in file.modules]
 
     def add_file_variables(self, file: ast.File):
         """Register all top-level assignments from a file."""
+        # New bindings can change what any expression evaluates to
+        self._eval_cache.clear()
+        self._evaluated_vars.clear()
         for defn in file.defs:
             if isinstance(defn, ast.Assignment):
                 if defn.assigner == "+=":
                     existing = self.variables.get(defn.name)
                     if existing is not None:
-                        self.variables[defn.name] = ast.OperatorExpr(
-                            left=existing, op="+", right=defn.value
+                        self.variables[defn.name] = self._append_value(
+                            existing, defn.value
                         )
                     else:
                         self.variables[defn.name] = defn.value
                 else:
                     self.variables[defn.name] = defn.value
 
+    def _append_value(self, existing, value):
+        """Combine a += right-hand side with the existing binding.
+
+        List and string appends are flattened eagerly instead of
+        building a depth-N OperatorExpr tree that re-concatenates on
+        every evaluation. A fresh node is always returned — AST nodes
+        are immutable once built, which the id-keyed caches (here and
+        in extract_string_list) depend on. Anything else falls back to
+        the OperatorExpr form resolved at evaluate time.
+        """
+        if isinstance(existing, ast.ListExpr) and isinstance(value, ast.ListExpr):
+            return ast.ListExpr(values=[*existing.values, *value.values])
+
+        if isinstance(existing, ast.StringExpr) and isinstance(value, ast.StringExpr):
+            return ast.StringExpr(value=existing.value + value.value)
+
+        return ast.OperatorExpr(left=existing, op="+", right=value)
+
     def evaluate(self, expr: ast.Expression) -> ast.Expression:
-        """Recursively evaluate an expression to a concrete value."""
-        if isinstance(expr, (ast.StringExpr, ast.BoolExpr, ast.IntExpr)):
+        """Recursively evaluate an expression to a concrete value.
+
+        Results are memoized per expression node, so a variable referenced
+        many times only has its sub-tree walked once. Dispatch goes
+        through a KIND-indexed jump table rather than an isinstance chain.
+        """
+        kind = getattr(expr, "KIND", None)
+        if kind is None or kind <= ast.KIND_INT:
             return expr
 
-        if isinstance(expr, ast.VariableRef):
-            if expr.name not in self.variables:
-                raise EvalError(f"Undefined variable: {expr.name}")
-            return self.evaluate(self.variables[expr.name])
-
-        if isinstance(expr, ast.OperatorExpr):
-            left = self.evaluate(expr.left)
-            right = self.evaluate(expr.right)
-
-            if expr.op == "+":
-                if isinstance(left, ast.ListExpr) and isinstance(right, ast.ListExpr):
-                    return ast.ListExpr(values=left.values + right.values)
-                if isinstance(left, ast.StringExpr) and isinstance(right, ast.StringExpr):
-                    return ast.StringExpr(value=left.value + right.value)
-                # If types don't match, return as-is for later handling
-                return ast.OperatorExpr(left=left, op=expr.op, right=right)
-
-            return ast.OperatorExpr(left=left, op=expr.op, right=right)
-
-        if isinstance(expr, ast.ListExpr):
-            return ast.ListExpr(values=[self.evaluate(v) for v in expr.values])
-
-        if isinstance(expr, ast.MapExpr):
-            return ast.MapExpr(
-                properties=[
-                    ast.Property(name=p.name, value=self.evaluate(p.value))
-                    for p in expr.properties
-                ]
-            )
-
-        if isinstance(expr, ast.SelectExpr):
-            # For now, return the select expression as-is (can be resolved
-            # later with target configuration)
+        cached = self._eval_cache.get(id(expr))
+        if cached is not None:
+            return cached[1]
+        result = self._dispatch[kind](expr)
+        self._eval_cache[id(expr)] = (expr, result)
+        return result
+
+    def _eval_varref(self, expr: ast.VariableRef) -> ast.Expression:
+        value = self._evaluated_vars.get(expr.name)
+        if value is not None:
+            return value
+        if expr.name not in self.variables:
+            raise EvalError(f"Undefined variable: {expr.name}")
+        value = self.evaluate(self.variables[expr.name])
+        self._evaluated_vars[expr.name] = value
+        return value
+
+    def _eval_operator(self, expr: ast.OperatorExpr) -> ast.Expression:
+        if expr.op == "+":
+            # a + b + c parses left-leaning as ((a + b) + c); evaluating
+            # pairwise would recopy the accumulated prefix at every
+            # level, O(n^2) for the long srcs chains in real AOSP files.
+            # Collect the whole chain first and merge once.
+            operands = []
+            node = expr
+            while node.KIND == ast.KIND_OPERATOR and node.op == "+":
+                operands.append(node.right)
+                node = node.left
+            operands.append(node)
+            operands.reverse()
+            values = [self.evaluate(o) for o in operands]
+
+            if all(v.KIND == ast.KIND_LIST for v in values):
+                merged = []
+                for v in values:
+                    merged.extend(v.values)
+                return ast.ListExpr(values=merged)
+            if all(v.KIND == ast.KIND_STRING for v in values):
+                return ast.StringExpr(value="".join(v.value for v in values))
+            # Mixed types: rebuild the evaluated chain for later handling
+            left = values[0]
+            for right in values[1:]:
+                left = ast.OperatorExpr(left=left, op="+", right=right)
+            return left
+
+        left = self.evaluate(expr.left)
+        right = self.evaluate(expr.right)
+        return ast.OperatorExpr(left=left, op=expr.op, right=right)
+
+    def _eval_list(self, expr: ast.ListExpr) -> ast.ListExpr:
+        # Common case: a big srcs/cflags list of pure literals evaluates
+        # to itself — skip the per-element copy entirely.
+        if all(v.KIND <= ast.KIND_INT for v in expr.values):
             return expr
+        return ast.ListExpr(values=[self.evaluate(v) for v in expr.values])
 
+    def _eval_map(self, expr: ast.MapExpr) -> ast.MapExpr:
+        if all(p.value.KIND <= ast.KIND_INT for p in expr.properties):
+            return expr
+        return ast.MapExpr(
+            properties=[
+                ast.Property(name=p.name, value=self.evaluate(p.value))
+                for p in expr.properties
+            ]
+        )
+
+    def _eval_select(self, expr: ast.SelectExpr) -> ast.SelectExpr:
+        # For now, return the select expression as-is (can be resolved
+        # later with target configuration)
         return expr
 
     def evaluate_module(self, module: ast.Module) -> ast.Module:
@@ -88,32 +187,49 @@ class Evaluator:
 
 def extract_string(expr: ast.Expression) -> Optional[str]:
     """Extract a string value from an expression, or None."""
-    if isinstance(expr, ast.StringExpr):
+    # KIND int compares instead of isinstance in these extractors — they
+    # run per property value in the handler hot path
+    if expr.KIND == ast.KIND_STRING:
         return expr.value
     return None
 
 
+# Extracted string lists keyed on id(expr), with the expression pinned so
+# the id stays valid. The same defaults/srcs ListExpr is re-extracted for
+# every module that references it; callers treat the result as read-only.
+# Safe because AST nodes are never mutated after construction — the
+# evaluator builds fresh nodes for += and + merges rather than extending
+# existing ones.
+_string_list_cache: Dict[int, tuple] = {}
+
+
+def clear_string_list_cache():
+    """Drop all memoized extractions (long-running batch processes)."""
+    _string_list_cache.clear()
+
+
 def extract_string_list(expr: ast.Expression) -> list:
     """Extract a list of strings from a list expression."""
-    if isinstance(expr, ast.ListExpr):
-        result = []
-        for v in expr.values:
-            s = extract_string(v)
-            if s is not None:
-                result.append(s)
+    if expr.KIND == ast.KIND_LIST:
+        cached = _string_list_cache.get(id(expr))
+        if cached is not None:
+            return cached[1]
+        kind_string = ast.KIND_STRING  # hoisted out of the comprehension
+        result = [v.value for v in expr.values if v.KIND == kind_string]
+        _string_list_cache[id(expr)] = (expr, result)
         return result
     return []
 
 
 def extract_bool(expr: ast.Expression) -> Optional[bool]:
     """Extract a boolean value from an expression, or None."""
-    if isinstance(expr, ast.BoolExpr):
+    if expr.KIND == ast.KIND_BOOL:
         return expr.value
     return None
 
 
 def extract_map(expr: ast.Expression) -> Optional[ast.MapExpr]:
     """Extract a map expression, or None."""
-    if isinstance(expr, ast.MapExpr):
+    if expr.KIND == ast.KIND_MAP:
         return expr
     return None
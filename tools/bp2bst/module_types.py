@@ -6,7 +6,27 @@ and produce a dictionary suitable for YAML serialization as a .bst element.
 
 from typing import Dict, List, Optional, Any
 from . import ast
-from .evaluator import extract_string, extract_string_list, extract_bool, extract_map
+from .evaluator import extract_string, extract_string_list, extract_bool
+
+
+# Library-dependency properties checked on every module, hoisted once
+_LIB_DEP_PROPS = ("static_libs", "shared_libs", "whole_static_libs",
+                  "header_libs")
+
+# Scaffolding shared across every generated element: the base depends
+# tuple is unpacked into each element's own list, while the sources list
+# for a given source_dir is built once and shared by reference between
+# all elements of that file (nothing downstream mutates element dicts).
+_BASE_DEPENDS = ("base/aosp-sdk.bst",)
+_shared_sources_cache: Dict[str, list] = {}
+
+
+def _shared_sources(source_dir: str) -> list:
+    sources = _shared_sources_cache.get(source_dir)
+    if sources is None:
+        sources = [{"kind": "local_external", "path": source_dir}] if source_dir else []
+        _shared_sources_cache[source_dir] = sources
+    return sources
 
 
 class ModuleHandler:
@@ -15,8 +35,16 @@ class ModuleHandler:
     # The Soong module type(s) this handler covers
     MODULE_TYPES: List[str] = []
 
+    # Frozen per subclass below so can_handle is a set lookup rather
+    # than a list scan (SkippedHandler covers 11 types)
+    _TYPE_SET: frozenset = frozenset()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._TYPE_SET = frozenset(cls.MODULE_TYPES)
+
     def can_handle(self, module_type: str) -> bool:
-        return module_type in self.MODULE_TYPES
+        return module_type in self._TYPE_SET
 
     def convert(self, module: ast.Module, target_arch: str = "x86_64",
                 source_dir: str = "") -> Optional[Dict[str, Any]]:
@@ -31,23 +59,30 @@ class ModuleHandler:
 class CcLibraryStaticHandler(ModuleHandler):
     MODULE_TYPES = ["cc_library_static"]
 
+    # Output shape knobs — subclasses override these instead of
+    # duplicating convert()
+    BUILD_TYPE = "static"
+    NAME_VAR = "lib-name"
+
     def convert(self, module, target_arch="x86_64", source_dir=""):
         name = module.name
         if not name:
             return None
 
-        srcs = self._get_srcs(module, target_arch)
-        cflags = self._get_cflags(module, target_arch)
+        arch_specific = self._arch_specific(module, target_arch)
+        srcs = self._get_srcs(module, arch_specific)
+        cflags = self._get_cflags(module, arch_specific)
         include_dirs = self._get_include_dirs(module)
         export_include_dirs = self._get_export_include_dirs(module)
+        deps = self._get_lib_deps(module)
 
         element = {
             "kind": "aosp_cc",
-            "depends": ["base/aosp-sdk.bst"],
-            "sources": [{"kind": "local_external", "path": source_dir}] if source_dir else [],
+            "depends": [*_BASE_DEPENDS, *deps],
+            "sources": _shared_sources(source_dir),
             "variables": {
-                "build-type": "static",
-                "lib-name": name,
+                "build-type": self.BUILD_TYPE,
+                self.NAME_VAR: name,
                 "src-files": " ".join(srcs),
             },
         }
@@ -55,52 +90,47 @@ class CcLibraryStaticHandler(ModuleHandler):
         if cflags:
             element["variables"]["extra-cflags"] = " ".join(cflags)
         if include_dirs or export_include_dirs:
-            all_includes = set(include_dirs + export_include_dirs)
-            flags = " ".join(f"-I{d}" for d in sorted(all_includes))
-            element["variables"]["include-flags"] = flags
-
-        # Add static_libs and shared_libs as dependencies
-        deps = self._get_lib_deps(module)
-        if deps:
-            element["depends"].extend(deps)
+            # dict.fromkeys dedupes while keeping declaration order, and
+            # the single prefixed join avoids per-dir f-string temporaries
+            all_includes = dict.fromkeys(include_dirs + export_include_dirs)
+            element["variables"]["include-flags"] = "-I" + " -I".join(all_includes)
 
         filename = f"{name}.bst"
         return {"filename": filename, "content": element}
 
-    def _get_srcs(self, module, target_arch):
+    def _arch_specific(self, module, target_arch):
+        """Get the arch: { <target_arch>: {...} } sub-map once per module."""
+        arch_prop = module.get("arch")
+        if arch_prop is not None and arch_prop.KIND == ast.KIND_MAP:
+            arch_specific = arch_prop.get(target_arch)
+            if arch_specific is not None and arch_specific.KIND == ast.KIND_MAP:
+                return arch_specific
+        return None
+
+    def _get_srcs(self, module, arch_specific):
         srcs = []
         srcs_prop = module.get("srcs")
         if srcs_prop:
             srcs.extend(extract_string_list(srcs_prop))
 
-        # Check arch-specific srcs
-        arch_prop = module.get("arch")
-        if arch_prop and isinstance(arch_prop, ast.MapExpr):
-            arch_map = extract_map(arch_prop)
-            if arch_map:
-                arch_specific = arch_map.get(target_arch)
-                if arch_specific and isinstance(arch_specific, ast.MapExpr):
-                    arch_srcs = arch_specific.get("srcs")
-                    if arch_srcs:
-                        srcs.extend(extract_string_list(arch_srcs))
+        # Arch-specific srcs
+        if arch_specific is not None:
+            arch_srcs = arch_specific.get("srcs")
+            if arch_srcs:
+                srcs.extend(extract_string_list(arch_srcs))
         return srcs
 
-    def _get_cflags(self, module, target_arch):
+    def _get_cflags(self, module, arch_specific):
         cflags = []
         cflags_prop = module.get("cflags")
         if cflags_prop:
             cflags.extend(extract_string_list(cflags_prop))
 
-        # Check arch-specific cflags
-        arch_prop = module.get("arch")
-        if arch_prop and isinstance(arch_prop, ast.MapExpr):
-            arch_map = extract_map(arch_prop)
-            if arch_map:
-                arch_specific = arch_map.get(target_arch)
-                if arch_specific and isinstance(arch_specific, ast.MapExpr):
-                    arch_cflags = arch_specific.get("cflags")
-                    if arch_cflags:
-                        cflags.extend(extract_string_list(arch_cflags))
+        # Arch-specific cflags
+        if arch_specific is not None:
+            arch_cflags = arch_specific.get("cflags")
+            if arch_cflags:
+                cflags.extend(extract_string_list(arch_cflags))
         return cflags
 
     def _get_include_dirs(self, module):
@@ -119,79 +149,38 @@ class CcLibraryStaticHandler(ModuleHandler):
             return extract_string_list(prop)
         return []
 
-    def _get_lib_deps(self, module):
-        deps = []
-        for dep_type in ("static_libs", "shared_libs", "whole_static_libs",
-                         "header_libs"):
+    def _get_lib_deps(self, module, _dep_props=_LIB_DEP_PROPS):
+        # dict keys dedupe in O(1) while keeping insertion order — the same
+        # lib commonly appears in both static_libs and whole_static_libs
+        # once defaults are merged in
+        deps = {}
+        for dep_type in _dep_props:
             prop = module.get(dep_type)
             if prop:
                 lib_names = extract_string_list(prop)
                 # Convert library names to .bst element references
                 # The actual path depends on where the dependency element lives
                 for lib_name in lib_names:
-                    deps.append(f"external/{lib_name}.bst")
-        return deps
+                    deps[f"external/{lib_name}.bst"] = None
+        return list(deps)
 
 
 class CcLibrarySharedHandler(CcLibraryStaticHandler):
     MODULE_TYPES = ["cc_library_shared"]
-
-    def convert(self, module, target_arch="x86_64", source_dir=""):
-        result = super().convert(module, target_arch, source_dir)
-        if result:
-            result["content"]["variables"]["build-type"] = "shared"
-        return result
+    BUILD_TYPE = "shared"
 
 
 class CcLibraryHandler(CcLibraryStaticHandler):
     """Handles cc_library which produces both static and shared variants.
     For simplicity, we generate a shared library by default."""
     MODULE_TYPES = ["cc_library"]
-
-    def convert(self, module, target_arch="x86_64", source_dir=""):
-        result = super().convert(module, target_arch, source_dir)
-        if result:
-            # cc_library defaults to shared output
-            result["content"]["variables"]["build-type"] = "shared"
-        return result
+    BUILD_TYPE = "shared"
 
 
 class CcBinaryHandler(CcLibraryStaticHandler):
     MODULE_TYPES = ["cc_binary", "cc_binary_host"]
-
-    def convert(self, module, target_arch="x86_64", source_dir=""):
-        name = module.name
-        if not name:
-            return None
-
-        srcs = self._get_srcs(module, target_arch)
-        cflags = self._get_cflags(module, target_arch)
-        include_dirs = self._get_include_dirs(module)
-        export_include_dirs = self._get_export_include_dirs(module)
-
-        element = {
-            "kind": "aosp_cc",
-            "depends": ["base/aosp-sdk.bst"],
-            "sources": [{"kind": "local_external", "path": source_dir}] if source_dir else [],
-            "variables": {
-                "build-type": "binary",
-                "binary-name": name,
-                "src-files": " ".join(srcs),
-            },
-        }
-
-        if cflags:
-            element["variables"]["extra-cflags"] = " ".join(cflags)
-        if include_dirs or export_include_dirs:
-            all_includes = set(include_dirs + export_include_dirs)
-            flags = " ".join(f"-I{d}" for d in sorted(all_includes))
-            element["variables"]["include-flags"] = flags
-
-        deps = self._get_lib_deps(module)
-        if deps:
-            element["depends"].extend(deps)
-
-        return {"filename": f"{name}.bst", "content": element}
+    BUILD_TYPE = "binary"
+    NAME_VAR = "binary-name"
 
 
 class CcDefaultsHandler(ModuleHandler):
@@ -220,7 +209,7 @@ class PrebuiltEtcHandler(ModuleHandler):
 
         element = {
             "kind": "import",
-            "sources": [{"kind": "local_external", "path": source_dir}] if source_dir else [],
+            "sources": _shared_sources(source_dir),
             "config": {"source": src, "target": "/etc"},
         }
 
@@ -251,18 +240,19 @@ _HANDLERS: List[ModuleHandler] = [
     SkippedHandler(),
 ]
 
+# Dispatch table resolved once at import time: module type -> handler.
+HANDLERS: Dict[str, ModuleHandler] = {
+    module_type: handler
+    for handler in _HANDLERS
+    for module_type in handler.MODULE_TYPES
+}
+
 
 def get_handler(module_type: str) -> Optional[ModuleHandler]:
     """Look up the handler for a given module type."""
-    for handler in _HANDLERS:
-        if handler.can_handle(module_type):
-            return handler
-    return None
+    return HANDLERS.get(module_type)
 
 
 def supported_types() -> List[str]:
     """Return list of all supported module types."""
-    types = []
-    for handler in _HANDLERS:
-        types.extend(handler.MODULE_TYPES)
-    return types
+    return list(HANDLERS)
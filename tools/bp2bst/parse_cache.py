@@ -0,0 +1,191 @@
+"""Persistent on-disk cache of parsed Android.bp ASTs.
+
+Re-parsing unchanged Android.bp files dominates incremental conversion
+runs on large trees. This module caches parsed ``ast.File`` objects
+under ``~/.cache/bp2bst/``, keyed by a SHA-256 of the source bytes plus
+the tool version, so a cache entry is invalidated whenever either the
+file contents or the parser change.
+
+On disk, ASTs are stored as a tagged-tuple wire format — each node
+becomes ``(tag, *fields)`` using the ``ast.KIND_*`` tags — serialized
+with orjson when available and pickle otherwise. Flat tuples of
+primitives load several times faster than pickled class instances and
+take less space.
+"""
+
+import hashlib
+import os
+import pickle
+import sys
+import tempfile
+
+from . import ast
+from .parser import parse_file
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bump whenever the parser or the wire format changes — stale entries
+# from an older tool must not be loaded.
+BP2BST_VERSION = "4"
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "bp2bst"
+)
+
+# Hit/miss counters for end-of-run reporting
+hits = 0
+misses = 0
+
+# Wire tags for non-expression nodes, continuing the ast.KIND_* numbering
+_TAG_ASSIGNMENT = 8
+_TAG_MODULE = 9
+_TAG_FILE = 10
+
+
+def _to_wire(node):
+    """Encode an AST node as a (tag, *fields) tuple tree."""
+    t = type(node)
+    if t is ast.StringExpr:
+        return (ast.KIND_STRING, node.value)
+    if t is ast.BoolExpr:
+        return (ast.KIND_BOOL, node.value)
+    if t is ast.IntExpr:
+        return (ast.KIND_INT, node.value)
+    if t is ast.ListExpr:
+        return (ast.KIND_LIST, [_to_wire(v) for v in node.values])
+    if t is ast.MapExpr:
+        return (ast.KIND_MAP, [(p.name, _to_wire(p.value)) for p in node.properties])
+    if t is ast.VariableRef:
+        return (ast.KIND_VARREF, node.name)
+    if t is ast.OperatorExpr:
+        return (ast.KIND_OPERATOR, _to_wire(node.left), node.op, _to_wire(node.right))
+    if t is ast.SelectExpr:
+        return (
+            ast.KIND_SELECT,
+            node.func_name,
+            node.func_args,
+            [([_to_wire(p) for p in patterns], _to_wire(value))
+             for patterns, value in node.cases],
+        )
+    if t is ast.Assignment:
+        return (_TAG_ASSIGNMENT, node.name, _to_wire(node.value), node.assigner)
+    if t is ast.Module:
+        return (_TAG_MODULE, node.type, [(p.name, _to_wire(p.value)) for p in node.properties])
+    if t is ast.File:
+        return (_TAG_FILE, node.name, [_to_wire(d) for d in node.defs])
+    raise TypeError(f"Cannot encode AST node: {node!r}")
+
+
+def _from_wire(obj):
+    """Decode a (tag, *fields) tuple tree back into AST nodes.
+
+    Identifier strings are re-interned so cache loads keep the same
+    deduplication the tokenizer provides.
+    """
+    tag = obj[0]
+    if tag == ast.KIND_STRING:
+        return ast.StringExpr(value=obj[1])
+    if tag == ast.KIND_BOOL:
+        return ast.BoolExpr(value=obj[1])
+    if tag == ast.KIND_INT:
+        return ast.IntExpr(value=obj[1])
+    if tag == ast.KIND_LIST:
+        return ast.ListExpr(values=[_from_wire(v) for v in obj[1]])
+    if tag == ast.KIND_MAP:
+        return ast.MapExpr(
+            properties=[
+                ast.Property(name=sys.intern(name), value=_from_wire(value))
+                for name, value in obj[1]
+            ]
+        )
+    if tag == ast.KIND_VARREF:
+        return ast.VariableRef(name=sys.intern(obj[1]))
+    if tag == ast.KIND_OPERATOR:
+        return ast.OperatorExpr(left=_from_wire(obj[1]), op=obj[2], right=_from_wire(obj[3]))
+    if tag == ast.KIND_SELECT:
+        return ast.SelectExpr(
+            func_name=sys.intern(obj[1]),
+            func_args=list(obj[2]),
+            cases=[([_from_wire(p) for p in patterns], _from_wire(value))
+                   for patterns, value in obj[3]],
+        )
+    if tag == _TAG_ASSIGNMENT:
+        return ast.Assignment(name=sys.intern(obj[1]), value=_from_wire(obj[2]), assigner=obj[3])
+    if tag == _TAG_MODULE:
+        return ast.Module(
+            type=sys.intern(obj[1]),
+            properties=[
+                ast.Property(name=sys.intern(name), value=_from_wire(value))
+                for name, value in obj[2]
+            ],
+        )
+    if tag == _TAG_FILE:
+        return ast.File(name=obj[1], defs=[_from_wire(d) for d in obj[2]])
+    raise ValueError(f"Unknown wire tag: {tag!r}")
+
+
+def _serialize(wire) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(wire)
+    return pickle.dumps(wire, protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def _deserialize(raw: bytes):
+    if orjson is not None:
+        return orjson.loads(raw)
+    return pickle.loads(raw)
+
+
+def load(filepath: str) -> ast.File:
+    """Parse an Android.bp file, using the on-disk AST cache if possible."""
+    global hits, misses
+
+    try:
+        with open(filepath, "rb") as f:
+            source = f.read()
+    except OSError:
+        # Let parse_file raise the usual error for missing files
+        return parse_file(filepath)
+
+    key = hashlib.sha256(source + BP2BST_VERSION.encode()).hexdigest()
+    ext = ".json" if orjson is not None else ".pkl"
+    cache_path = os.path.join(CACHE_DIR, key + ext)
+
+    try:
+        with open(cache_path, "rb") as f:
+            file_ast = _from_wire(_deserialize(f.read()))
+        hits += 1
+        return file_ast
+    except (OSError, ValueError, TypeError, IndexError,
+            pickle.UnpicklingError, EOFError):
+        pass
+
+    misses += 1
+    file_ast = parse_file(filepath)
+    _store(cache_path, file_ast)
+    return file_ast
+
+
+def _store(cache_path: str, file_ast: ast.File):
+    """Atomically write a serialized AST to the cache (best-effort)."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(_serialize(_to_wire(file_ast)))
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        # A broken cache must never break conversion
+        pass
+
+
+def stats() -> str:
+    """Return a one-line summary of cache effectiveness for this run."""
+    return f"parse cache: {hits} hit(s), {misses} miss(es)"
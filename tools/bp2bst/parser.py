@@ -9,9 +9,19 @@ Handles:
 - select() expressions
 - // and /* */ comments
 - += assignments
+
+Tokenization is a single pass of one master regex over the source; the
+token stream is stored as parallel arrays (types, values) rather than
+per-token objects, and the parser indexes straight into them.
+Offsets, line and column are derived by re-scanning the source only
+when an error is raised.
 """
 
+import functools
+import mmap
+import os
 import re
+import sys
 from typing import Optional
 from . import ast
 
@@ -23,253 +33,218 @@ class ParseError(Exception):
         super().__init__(f"line {line}, col {col}: {message}")
 
 
-class Token:
-    __slots__ = ("type", "value", "line", "col")
-
-    def __init__(self, type_, value, line=0, col=0):
-        self.type = type_
-        self.value = value
-        self.line = line
-        self.col = col
-
-    def __repr__(self):
-        return f"Token({self.type}, {self.value!r}, L{self.line})"
-
-
-# Token types
-TOK_IDENT = "IDENT"
-TOK_STRING = "STRING"
-TOK_INT = "INT"
-TOK_LBRACE = "LBRACE"    # {
-TOK_RBRACE = "RBRACE"    # }
-TOK_LBRACKET = "LBRACKET" # [
-TOK_RBRACKET = "RBRACKET" # ]
-TOK_LPAREN = "LPAREN"    # (
-TOK_RPAREN = "RPAREN"    # )
-TOK_COLON = "COLON"      # :
-TOK_COMMA = "COMMA"      # ,
-TOK_EQUALS = "EQUALS"    # =
-TOK_PLUS = "PLUS"        # +
-TOK_PLUSEQ = "PLUSEQ"     # +=
-TOK_EOF = "EOF"
+# Token types — small ints so comparisons are int-compares
+TOK_IDENT = 0
+TOK_STRING = 1
+TOK_INT = 2
+TOK_LBRACE = 3     # {
+TOK_RBRACE = 4     # }
+TOK_LBRACKET = 5   # [
+TOK_RBRACKET = 6   # ]
+TOK_LPAREN = 7     # (
+TOK_RPAREN = 8     # )
+TOK_COLON = 9      # :
+TOK_COMMA = 10     # ,
+TOK_EQUALS = 11    # =
+TOK_PLUS = 12      # +
+TOK_PLUSEQ = 13    # +=
+TOK_EOF = 14
+
+# Names indexed by token type, for error messages
+_TOK_NAMES = (
+    "IDENT", "STRING", "INT", "LBRACE", "RBRACE", "LBRACKET", "RBRACKET",
+    "LPAREN", "RPAREN", "COLON", "COMMA", "EQUALS", "PLUS", "PLUSEQ", "EOF",
+)
 
 # Reserved keywords that look like identifiers
 KEYWORDS = {"true", "false", "select", "unset"}
 
-
-class Lexer:
-    """Tokenizer for Android.bp files."""
-
-    def __init__(self, text: str, filename: str = "<input>"):
-        self.text = text
-        self.filename = filename
-        self.pos = 0
-        self.line = 1
-        self.col = 1
-
-    def _advance(self, n=1):
-        for i in range(n):
-            if self.pos < len(self.text):
-                if self.text[self.pos] == "\n":
-                    self.line += 1
-                    self.col = 1
-                else:
-                    self.col += 1
-                self.pos += 1
-
-    def _peek(self) -> Optional[str]:
-        if self.pos < len(self.text):
-            return self.text[self.pos]
-        return None
-
-    def _peek2(self) -> Optional[str]:
-        if self.pos + 1 < len(self.text):
-            return self.text[self.pos + 1]
-        return None
-
-    def _skip_whitespace_and_comments(self):
-        while self.pos < len(self.text):
-            c = self.text[self.pos]
-
-            # Whitespace
-            if c in " \t\r\n":
-                self._advance()
-                continue
-
-            # Line comment
-            if c == "/" and self._peek2() == "/":
-                while self.pos < len(self.text) and self.text[self.pos] != "\n":
-                    self._advance()
-                continue
-
-            # Block comment
-            if c == "/" and self._peek2() == "*":
-                self._advance(2)
-                while self.pos < len(self.text):
-                    if self.text[self.pos] == "*" and self._peek2() == "/":
-                        self._advance(2)
-                        break
-                    self._advance()
-                continue
-
+# Master token pattern — one C-level match per token. The
+# whitespace/comment alternative has no capture group, so skipped runs
+# are recognized by m.lastindex being None. Identifier and digit runs
+# are matched by the regex engine's own character-class bitmaps, so no
+# per-character classification happens in Python.
+_MASTER = re.compile(
+    r'"((?:\\.|[^"\\])*)"'                        # 1: string literal
+    r"|(?:[ \t\r\n]+|//[^\n]*|/\*[\s\S]*?\*/)+"   # whitespace / comments
+    r"|([A-Za-z_]\w*)"                            # 2: identifier
+    r"|(-?\d+)"                                   # 3: integer
+    r"|(\+=|[{}\[\]():,=+])"                      # 4: punctuation
+)
+
+_PUNCT_TYPES = {
+    "{": TOK_LBRACE,
+    "}": TOK_RBRACE,
+    "[": TOK_LBRACKET,
+    "]": TOK_RBRACKET,
+    "(": TOK_LPAREN,
+    ")": TOK_RPAREN,
+    ":": TOK_COLON,
+    ",": TOK_COMMA,
+    "=": TOK_EQUALS,
+    "+": TOK_PLUS,
+    "+=": TOK_PLUSEQ,
+}
+
+# Escape decoding rides the C regex engine: string bodies (escapes
+# included) are consumed by the master pattern above, and the rare
+# literal that actually contains a backslash is rewritten by one
+# _ESCAPE_RE.sub call. No per-character Python loop remains in the
+# lexer, so there is nothing left worth JIT-compiling here.
+_ESCAPE_RE = re.compile(r"\\(.)", re.DOTALL)
+_ESCAPE_MAP = {"n": "\n", "t": "\t"}
+
+# String literals up to this length are deduplicated per file — source
+# paths, arch names and compiler flags repeat constantly in Android.bp
+STR_INTERN_THRESHOLD = 32
+
+
+def _unescape(m):
+    c = m.group(1)
+    return _ESCAPE_MAP.get(c, c)
+
+
+def _location(text, offset):
+    """Derive (line, col) for a source offset. Error path only."""
+    line = text.count("\n", 0, offset) + 1
+    col = offset - text.rfind("\n", 0, offset)
+    return line, col
+
+
+def _token_offset(text, index):
+    """Recover the source offset of token number ``index``.
+
+    Error path only — offsets are not kept per token, so the source is
+    re-scanned counting matches until the wanted token.
+    """
+    match = _MASTER.match
+    pos = 0
+    n = len(text)
+    count = 0
+    while pos < n:
+        m = match(text, pos)
+        if m is None:
             break
-
-    def _read_string(self) -> str:
-        """Read a double-quoted string, handling escape sequences."""
-        assert self.text[self.pos] == '"'
-        self._advance()  # skip opening quote
-        result = []
-        while self.pos < len(self.text):
-            c = self.text[self.pos]
-            if c == "\\":
-                self._advance()
-                if self.pos < len(self.text):
-                    esc = self.text[self.pos]
-                    if esc == "n":
-                        result.append("\n")
-                    elif esc == "t":
-                        result.append("\t")
-                    elif esc == "\\":
-                        result.append("\\")
-                    elif esc == '"':
-                        result.append('"')
-                    else:
-                        result.append(esc)
-                    self._advance()
-            elif c == '"':
-                self._advance()  # skip closing quote
-                return "".join(result)
-            else:
-                result.append(c)
-                self._advance()
-        raise ParseError("Unterminated string", self.line, self.col)
-
-    def _read_ident(self) -> str:
-        """Read an identifier: [a-zA-Z_][a-zA-Z0-9_]*."""
-        start = self.pos
-        while self.pos < len(self.text) and (
-            self.text[self.pos].isalnum() or self.text[self.pos] == "_"
-        ):
-            self._advance()
-        return self.text[start : self.pos]
-
-    def _read_int(self) -> int:
-        """Read an integer literal."""
-        start = self.pos
-        if self.text[self.pos] == "-":
-            self._advance()
-        while self.pos < len(self.text) and self.text[self.pos].isdigit():
-            self._advance()
-        return int(self.text[start : self.pos])
-
-    def next_token(self) -> Token:
-        self._skip_whitespace_and_comments()
-
-        if self.pos >= len(self.text):
-            return Token(TOK_EOF, "", self.line, self.col)
-
-        line, col = self.line, self.col
-        c = self.text[self.pos]
-
-        if c == '"':
-            value = self._read_string()
-            return Token(TOK_STRING, value, line, col)
-
-        if c.isalpha() or c == "_":
-            value = self._read_ident()
-            return Token(TOK_IDENT, value, line, col)
-
-        if c.isdigit() or (c == "-" and self.pos + 1 < len(self.text) and self.text[self.pos + 1].isdigit()):
-            value = self._read_int()
-            return Token(TOK_INT, value, line, col)
-
-        if c == "{":
-            self._advance()
-            return Token(TOK_LBRACE, "{", line, col)
-        if c == "}":
-            self._advance()
-            return Token(TOK_RBRACE, "}", line, col)
-        if c == "[":
-            self._advance()
-            return Token(TOK_LBRACKET, "[", line, col)
-        if c == "]":
-            self._advance()
-            return Token(TOK_RBRACKET, "]", line, col)
-        if c == "(":
-            self._advance()
-            return Token(TOK_LPAREN, "(", line, col)
-        if c == ")":
-            self._advance()
-            return Token(TOK_RPAREN, ")", line, col)
-        if c == ":":
-            self._advance()
-            return Token(TOK_COLON, ":", line, col)
-        if c == ",":
-            self._advance()
-            return Token(TOK_COMMA, ",", line, col)
-        if c == "+":
-            self._advance()
-            if self._peek() == "=":
-                self._advance()
-                return Token(TOK_PLUSEQ, "+=", line, col)
-            return Token(TOK_PLUS, "+", line, col)
-        if c == "=":
-            self._advance()
-            return Token(TOK_EQUALS, "=", line, col)
-
-        raise ParseError(f"Unexpected character: {c!r}", line, col)
-
-    def tokenize(self) -> list:
-        """Tokenize the entire input and return a list of tokens."""
-        tokens = []
-        while True:
-            tok = self.next_token()
-            tokens.append(tok)
-            if tok.type == TOK_EOF:
+        if m.lastindex is not None:
+            if count == index:
+                return m.start()
+            count += 1
+        pos = m.end()
+    return n
+
+
+def _tokenize(text):
+    """Tokenize source into parallel (types, values) arrays.
+
+    A TOK_EOF sentinel is appended, so lookahead never needs a bounds
+    check. Token offsets are deliberately not stored — they are only
+    needed to format errors, and _token_offset recovers them then.
+    """
+    types = []
+    values = []
+    add_type = types.append
+    add_value = values.append
+    match = _MASTER.match
+    intern = sys.intern
+    short_strs = {}
+
+    pos = 0
+    n = len(text)
+    while pos < n:
+        m = match(text, pos)
+        if m is None:
+            if text.startswith("/*", pos):
+                # Unterminated block comment swallows the rest
                 break
-        return tokens
+            if text[pos] == '"':
+                raise ParseError("Unterminated string", *_location(text, pos))
+            raise ParseError(
+                f"Unexpected character: {text[pos]!r}", *_location(text, pos)
+            )
+        gid = m.lastindex
+        if gid is not None:
+            if gid == 2:
+                # Identifiers ("name", "srcs", module types, ...) repeat
+                # across every module; intern them so the AST holds one
+                # canonical str per name and property-dict lookups hit
+                # CPython's pointer-equality fast path against the
+                # (implicitly interned) literal keys at the call sites.
+                add_type(TOK_IDENT)
+                add_value(intern(m.group(2)))
+            elif gid == 1:
+                value = m.group(1)
+                if "\\" in value:
+                    value = _ESCAPE_RE.sub(_unescape, value)
+                if len(value) < STR_INTERN_THRESHOLD:
+                    value = short_strs.setdefault(value, value)
+                add_type(TOK_STRING)
+                add_value(value)
+            elif gid == 4:
+                value = m.group(4)
+                add_type(_PUNCT_TYPES[value])
+                add_value(value)
+            else:
+                add_type(TOK_INT)
+                add_value(int(m.group(3)))
+        pos = m.end()
+
+    add_type(TOK_EOF)
+    add_value("")
+    return types, values
 
 
 class Parser:
-    """Recursive descent parser for Android.bp files."""
+    """Recursive descent parser over the flat token arrays.
+
+    Deliberately kept pure CPython: the tokenizer already spends its
+    time inside the C regex engine, and an AOT-compiled (Cython/mypyc)
+    build is not worth a compiled-extension dependency for a PoC
+    conversion tool. Slots keep instance access on the fast path.
+    """
+
+    __slots__ = ("text", "filename", "types", "values", "pos")
 
     def __init__(self, text: str, filename: str = "<input>"):
-        self.lexer = Lexer(text, filename)
-        self.tokens = self.lexer.tokenize()
-        self.pos = 0
+        self.text = text
         self.filename = filename
+        self.types, self.values = _tokenize(text)
+        self.pos = 0
 
-    def _peek(self) -> Token:
-        if self.pos < len(self.tokens):
-            return self.tokens[self.pos]
-        return Token(TOK_EOF, "", 0, 0)
+    def _error(self, message, index: Optional[int] = None):
+        if index is None:
+            index = self.pos
+        offset = _token_offset(self.text, index)
+        raise ParseError(message, *_location(self.text, offset))
 
-    def _advance(self) -> Token:
-        tok = self._peek()
+    def _advance(self):
+        """Consume the current token and return its value."""
+        value = self.values[self.pos]
         self.pos += 1
-        return tok
-
-    def _expect(self, type_: str) -> Token:
-        tok = self._advance()
-        if tok.type != type_:
-            raise ParseError(
-                f"Expected {type_}, got {tok.type} ({tok.value!r})",
-                tok.line, tok.col,
+        return value
+
+    def _expect(self, type_: int):
+        pos = self.pos
+        if self.types[pos] != type_:
+            self._error(
+                f"Expected {_TOK_NAMES[type_]}, got "
+                f"{_TOK_NAMES[self.types[pos]]} ({self.values[pos]!r})"
             )
-        return tok
+        self.pos = pos + 1
+        return self.values[pos]
 
-    def _at(self, type_: str) -> bool:
-        return self._peek().type == type_
+    def _at(self, type_: int) -> bool:
+        return self.types[self.pos] == type_
 
-    def _match(self, type_: str) -> Optional[Token]:
-        if self._at(type_):
-            return self._advance()
-        return None
+    def _match(self, type_: int) -> bool:
+        if self.types[self.pos] == type_:
+            self.pos += 1
+            return True
+        return False
 
     def parse(self) -> ast.File:
         """Parse the entire file and return an AST File node."""
         file = ast.File(name=self.filename)
-        while not self._at(TOK_EOF):
+        while self.types[self.pos] != TOK_EOF:
             defn = self._parse_definition()
             if defn is not None:
                 file.defs.append(defn)
@@ -277,68 +252,77 @@ class Parser:
 
     def _parse_definition(self):
         """Parse a top-level definition: module or assignment."""
-        tok = self._peek()
-
-        if tok.type != TOK_IDENT:
-            raise ParseError(
-                f"Expected identifier at top level, got {tok.type} ({tok.value!r})",
-                tok.line, tok.col,
+        pos = self.pos
+        if self.types[pos] != TOK_IDENT:
+            self._error(
+                f"Expected identifier at top level, got "
+                f"{_TOK_NAMES[self.types[pos]]} ({self.values[pos]!r})"
             )
 
         # Look ahead to determine if this is an assignment or a module
         # Assignment: ident = expr  or  ident += expr
         # Module: ident { ... }
-        next_tok = self.tokens[self.pos + 1] if self.pos + 1 < len(self.tokens) else Token(TOK_EOF, "", 0, 0)
+        next_type = self.types[pos + 1]
 
-        if next_tok.type in (TOK_EQUALS, TOK_PLUSEQ):
+        if next_type == TOK_EQUALS or next_type == TOK_PLUSEQ:
             return self._parse_assignment()
-        elif next_tok.type == TOK_LBRACE:
+        elif next_type == TOK_LBRACE:
             return self._parse_module()
         else:
-            raise ParseError(
-                f"Expected '=', '+=', or '{{' after identifier '{tok.value}', got {next_tok.type}",
-                next_tok.line, next_tok.col,
+            self._error(
+                f"Expected '=', '+=', or '{{' after identifier "
+                f"'{self.values[pos]}', got {_TOK_NAMES[next_type]}",
+                pos + 1,
             )
 
     def _parse_assignment(self) -> ast.Assignment:
-        name_tok = self._expect(TOK_IDENT)
-        if self._at(TOK_PLUSEQ):
-            assigner_tok = self._advance()
+        name = self._expect(TOK_IDENT)
+        if self._match(TOK_PLUSEQ):
             assigner = "+="
         else:
-            assigner_tok = self._expect(TOK_EQUALS)
+            self._expect(TOK_EQUALS)
             assigner = "="
         value = self._parse_expression()
-        return ast.Assignment(name=name_tok.value, value=value, assigner=assigner)
+        return ast.Assignment(name=name, value=value, assigner=assigner)
 
     def _parse_module(self) -> ast.Module:
-        type_tok = self._expect(TOK_IDENT)
+        type_ = self._expect(TOK_IDENT)
         properties = self._parse_map_body()
-        return ast.Module(type=type_tok.value, properties=properties)
+        return ast.Module(type=type_, properties=properties)
 
     def _parse_map_body(self) -> list:
-        """Parse { prop: val, prop: val, ... } and return list of Property."""
+        """Parse { prop: val, prop: val, ... } and return list of Property.
+
+        This and the other hot parse loops compare token-type ints on
+        hoisted locals rather than going through _at/_match calls.
+        """
         self._expect(TOK_LBRACE)
         properties = []
-        while not self._at(TOK_RBRACE) and not self._at(TOK_EOF):
-            prop = self._parse_property()
-            properties.append(prop)
-            self._match(TOK_COMMA)  # optional trailing comma
+        append = properties.append
+        types = self.types
+        while True:
+            type_ = types[self.pos]
+            if type_ == TOK_RBRACE or type_ == TOK_EOF:
+                break
+            append(self._parse_property())
+            if types[self.pos] == TOK_COMMA:  # optional trailing comma
+                self.pos += 1
         self._expect(TOK_RBRACE)
         return properties
 
     def _parse_property(self) -> ast.Property:
-        name_tok = self._expect(TOK_IDENT)
+        name = self._expect(TOK_IDENT)
         self._expect(TOK_COLON)
         value = self._parse_expression()
-        return ast.Property(name=name_tok.value, value=value)
+        return ast.Property(name=name, value=value)
 
     def _parse_expression(self) -> ast.Expression:
         """Parse an expression, handling + concatenation."""
         left = self._parse_primary()
 
-        while self._at(TOK_PLUS):
-            self._advance()  # consume +
+        types = self.types
+        while types[self.pos] == TOK_PLUS:
+            self.pos += 1
             right = self._parse_primary()
             left = ast.OperatorExpr(left=left, op="+", right=right)
 
@@ -346,53 +330,58 @@ class Parser:
 
     def _parse_primary(self) -> ast.Expression:
         """Parse a primary expression."""
-        tok = self._peek()
+        type_ = self.types[self.pos]
 
-        if tok.type == TOK_STRING:
-            self._advance()
-            return ast.StringExpr(value=tok.value)
+        if type_ == TOK_STRING:
+            return ast.StringExpr(value=self._advance())
 
-        if tok.type == TOK_INT:
-            self._advance()
-            return ast.IntExpr(value=tok.value)
+        if type_ == TOK_INT:
+            return ast.IntExpr(value=self._advance())
 
-        if tok.type == TOK_LBRACKET:
+        if type_ == TOK_LBRACKET:
             return self._parse_list()
 
-        if tok.type == TOK_LBRACE:
+        if type_ == TOK_LBRACE:
             props = self._parse_map_body()
             return ast.MapExpr(properties=props)
 
-        if tok.type == TOK_IDENT:
-            if tok.value == "true":
-                self._advance()
+        if type_ == TOK_IDENT:
+            value = self.values[self.pos]
+            if value == "true":
+                self.pos += 1
                 return ast.BoolExpr(value=True)
-            if tok.value == "false":
-                self._advance()
+            if value == "false":
+                self.pos += 1
                 return ast.BoolExpr(value=False)
-            if tok.value == "unset":
-                self._advance()
+            if value == "unset":
+                self.pos += 1
                 return ast.StringExpr(value="__unset__")
-            if tok.value == "select":
+            if value == "select":
                 return self._parse_select()
 
             # Check if this is a module (ident followed by {) — shouldn't
             # happen inside expressions, but just in case treat as variable ref
-            self._advance()
-            return ast.VariableRef(name=tok.value)
+            self.pos += 1
+            return ast.VariableRef(name=value)
 
-        raise ParseError(
-            f"Unexpected token in expression: {tok.type} ({tok.value!r})",
-            tok.line, tok.col,
+        self._error(
+            f"Unexpected token in expression: "
+            f"{_TOK_NAMES[type_]} ({self.values[self.pos]!r})"
         )
 
     def _parse_list(self) -> ast.ListExpr:
         """Parse [ expr, expr, ... ]."""
         self._expect(TOK_LBRACKET)
         values = []
-        while not self._at(TOK_RBRACKET) and not self._at(TOK_EOF):
-            values.append(self._parse_expression())
-            self._match(TOK_COMMA)  # optional trailing comma
+        append = values.append
+        types = self.types
+        while True:
+            type_ = types[self.pos]
+            if type_ == TOK_RBRACKET or type_ == TOK_EOF:
+                break
+            append(self._parse_expression())
+            if types[self.pos] == TOK_COMMA:  # optional trailing comma
+                self.pos += 1
         self._expect(TOK_RBRACKET)
         return ast.ListExpr(values=values)
 
@@ -402,12 +391,11 @@ class Parser:
         self._expect(TOK_LPAREN)
 
         # Parse condition: func_name("arg1", "arg2", ...)
-        func_name_tok = self._expect(TOK_IDENT)
+        func_name = self._expect(TOK_IDENT)
         self._expect(TOK_LPAREN)
         func_args = []
         while not self._at(TOK_RPAREN) and not self._at(TOK_EOF):
-            arg_tok = self._expect(TOK_STRING)
-            func_args.append(arg_tok.value)
+            func_args.append(self._expect(TOK_STRING))
             self._match(TOK_COMMA)
         self._expect(TOK_RPAREN)
 
@@ -418,25 +406,19 @@ class Parser:
         cases = []
         while not self._at(TOK_RBRACE) and not self._at(TOK_EOF):
             # Pattern can be string, "default", or "any" identifier
-            if self._at(TOK_STRING):
-                pattern_tok = self._advance()
-                patterns = [ast.StringExpr(pattern_tok.value)]
-            elif self._at(TOK_IDENT):
-                pattern_tok = self._advance()
-                patterns = [ast.StringExpr(pattern_tok.value)]
-            elif self._at(TOK_LPAREN):
+            if self._at(TOK_STRING) or self._at(TOK_IDENT):
+                patterns = [ast.StringExpr(self._advance())]
+            elif self._match(TOK_LPAREN):
                 # Tuple pattern: ("val1", "val2")
-                self._advance()
                 patterns = []
                 while not self._at(TOK_RPAREN):
-                    p = self._expect(TOK_STRING)
-                    patterns.append(ast.StringExpr(p.value))
+                    patterns.append(ast.StringExpr(self._expect(TOK_STRING)))
                     self._match(TOK_COMMA)
                 self._expect(TOK_RPAREN)
             else:
-                raise ParseError(
-                    f"Expected pattern in select case, got {self._peek().type}",
-                    self._peek().line, self._peek().col,
+                self._error(
+                    f"Expected pattern in select case, got "
+                    f"{_TOK_NAMES[self.types[self.pos]]}"
                 )
 
             self._expect(TOK_COLON)
@@ -448,16 +430,55 @@ class Parser:
         self._expect(TOK_RPAREN)
 
         return ast.SelectExpr(
-            func_name=func_name_tok.value,
+            func_name=func_name,
             func_args=func_args,
             cases=cases,
         )
 
 
 def parse_file(filepath: str) -> ast.File:
-    """Parse an Android.bp file and return an AST."""
-    with open(filepath, "r") as f:
-        text = f.read()
+    """Parse an Android.bp file and return an AST.
+
+    Results are memoized per (realpath, mtime) across the process, so
+    repeat conversions of the same file — multi-target runs, the test
+    suite reconverting the same AOSP_ROOT files — hit the cache. The
+    returned AST is shared between callers and must be treated as
+    read-only; everything downstream (evaluator, defaults resolver,
+    handlers) already builds new nodes rather than mutating parsed ones.
+    """
+    path = os.path.realpath(filepath)
+    return _parse_file_cached(path, os.stat(path).st_mtime_ns)
+
+
+def clear_parse_cache():
+    """Drop all memoized parse_file results (for tests / batch tools)."""
+    _parse_file_cached.cache_clear()
+
+
+# Files below this size are read with one os.read instead of mmap —
+# most Android.bp files are a few KB and the mapping setup costs more
+# than it saves there
+_MMAP_THRESHOLD = 1 << 16
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_file_cached(filepath: str, _mtime_ns: int) -> ast.File:
+    # Small files: open/fstat/read/close with no Python buffering layer.
+    # Large files: memory-mapped and prefetched sequentially, skipping
+    # the text-mode I/O layer and its newline translation.
+    fd = os.open(filepath, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        if size < _MMAP_THRESHOLD:
+            text = os.read(fd, size).decode("utf-8")
+        else:
+            with mmap.mmap(fd, 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, "madvise"):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                    mm.madvise(mmap.MADV_WILLNEED)
+                text = bytes(mm).decode("utf-8")
+    finally:
+        os.close(fd)
     parser = Parser(text, filename=filepath)
     return parser.parse()
 
@@ -0,0 +1,19 @@
+"""bp2bst test suite.
+
+The path setup below runs once when the package is imported, instead of
+per test module. Run the suite from tools/ with:
+
+    python -m unittest discover -s bp2bst/tests
+
+Test classes are independent (module-level caches are shared but
+read-only), so the suite is also safe to spread across workers with
+pytest-xdist (``pytest -n auto bp2bst/tests``) where that is installed;
+it is deliberately not a dependency of this PoC.
+"""
+
+import os
+import sys
+
+_TOOLS_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if _TOOLS_DIR not in sys.path:
+    sys.path.insert(0, _TOOLS_DIR)
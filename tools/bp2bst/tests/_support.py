@@ -0,0 +1,52 @@
+"""Shared helpers for the bp2bst test suite."""
+
+import os
+import unittest
+from functools import lru_cache
+
+from bp2bst.parser import parse_file, parse_string
+
+
+class AospTestCase(unittest.TestCase):
+    """Base for tests needing a real AOSP checkout.
+
+    The tree's existence is checked once per class in setUpClass — one
+    stat instead of one per test method — and the whole class is
+    skipped when it is absent.
+    """
+
+    AOSP_ROOT = "/home/vgrade/AAOS-RE/aosp"
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        if not os.path.isdir(cls.AOSP_ROOT):
+            raise unittest.SkipTest("AOSP tree not available")
+
+# The suite parses many identical source literals; lexing+parsing is its
+# dominant cost, so identical inputs share one cached AST. Parsed ASTs
+# are read-only by contract, which makes sharing across tests safe.
+# This also covers what hoisting snippets to pre-parsed module-level
+# constants would buy: each unique snippet is parsed once per run, while
+# the source stays inline next to the assertions that read it.
+parse_cached = lru_cache(maxsize=256)(parse_string)
+
+class StringListAssertions:
+    """Mixin asserting directly against a ListExpr's values.
+
+    Compares in place instead of materializing an intermediate string
+    list with extract_string_list just to throw it away.
+    """
+
+    def assertStringListEqual(self, list_expr, expected):
+        values = list_expr.values
+        self.assertEqual(len(values), len(expected))
+        for v, e in zip(values, expected):
+            self.assertEqual(v.value, e)
+
+
+# Real-file loads need no extra wrapper: parse_file is memoized
+# process-wide per (realpath, mtime), so every test class touching the
+# same AOSP blueprint shares one parse. Named here so test call sites
+# say what they rely on.
+load_bp = parse_file
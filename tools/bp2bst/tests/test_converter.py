@@ -1,25 +1,20 @@
 """Tests for the full converter pipeline."""
 
 import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if __package__ in (None, ""):  # direct run: python test_foo.py
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
 from bp2bst.converter import Converter
+from bp2bst.tests._support import AospTestCase
 
 
-class TestConverterRealFiles(unittest.TestCase):
+class TestConverterRealFiles(AospTestCase):
     """Integration tests against real Android.bp files."""
 
-    AOSP_ROOT = "/home/vgrade/AAOS-RE/aosp"
-
-    def _skip_if_no_aosp(self):
-        if not os.path.isdir(self.AOSP_ROOT):
-            self.skipTest("AOSP tree not available")
-
     def test_bzip2_conversion(self):
-        self._skip_if_no_aosp()
         converter = Converter(target_arch="x86_64")
         bp_path = os.path.join(self.AOSP_ROOT, "external/bzip2/Android.bp")
         result = converter.convert_file(bp_path, output_prefix="external/bzip2")
@@ -39,7 +34,6 @@ class TestConverterRealFiles(unittest.TestCase):
         self.assertIn("blocksort.c", libbz["content"]["variables"]["src-files"])
 
     def test_expat_conversion(self):
-        self._skip_if_no_aosp()
         converter = Converter(target_arch="x86_64")
         bp_path = os.path.join(self.AOSP_ROOT, "external/expat/Android.bp")
         result = converter.convert_file(bp_path, output_prefix="external/expat")
@@ -49,7 +43,6 @@ class TestConverterRealFiles(unittest.TestCase):
         self.assertIn("external/expat/libexpat.bst", result.elements[0]["filename"])
 
     def test_zlib_conversion(self):
-        self._skip_if_no_aosp()
         converter = Converter(target_arch="x86_64")
         bp_path = os.path.join(self.AOSP_ROOT, "external/zlib/Android.bp")
         result = converter.convert_file(bp_path, output_prefix="external/zlib")
@@ -63,7 +56,6 @@ class TestConverterRealFiles(unittest.TestCase):
         self.assertIn("external/zlib/libz_static.bst", filenames)
 
     def test_libpng_conversion(self):
-        self._skip_if_no_aosp()
         converter = Converter(target_arch="x86_64")
         bp_path = os.path.join(self.AOSP_ROOT, "external/libpng/Android.bp")
         result = converter.convert_file(bp_path, output_prefix="external/libpng")
@@ -75,7 +67,8 @@ class TestConverterRealFiles(unittest.TestCase):
         # libpng should depend on libz
         libpng = [e for e in result.elements if "libpng.bst" in e["filename"]][0]
         deps = libpng["content"]["depends"]
-        self.assertTrue(any("libz" in d for d in deps), "libpng should depend on libz")
+        dep_names = {d.rsplit("/", 1)[-1] for d in deps}
+        self.assertIn("libz.bst", dep_names, "libpng should depend on libz")
 
 
 if __name__ == "__main__":
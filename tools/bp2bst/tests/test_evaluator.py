@@ -1,21 +1,22 @@
 """Tests for the evaluator and defaults resolver."""
 
 import os
-import sys
 import unittest
 
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+if __package__ in (None, ""):  # direct run: python test_foo.py
+    import sys
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
 
-from bp2bst.parser import parse_string
+from bp2bst.tests._support import AospTestCase, StringListAssertions, load_bp, parse_cached
 from bp2bst.evaluator import Evaluator, extract_string, extract_string_list
 from bp2bst.defaults import DefaultsResolver
 from bp2bst import ast
 
 
-class TestEvaluator(unittest.TestCase):
+class TestEvaluator(StringListAssertions, unittest.TestCase):
 
     def test_resolve_variable(self):
-        f = parse_string('my_flags = ["-Wall", "-Werror"]')
+        f = parse_cached('my_flags = ["-Wall", "-Werror"]')
         ev = Evaluator()
         ev.add_file_variables(f)
         result = ev.evaluate(ast.VariableRef(name="my_flags"))
@@ -23,38 +24,35 @@ class TestEvaluator(unittest.TestCase):
         self.assertEqual(len(result.values), 2)
 
     def test_list_concat(self):
-        f = parse_string('a = ["x"]\nb = a + ["y"]')
+        f = parse_cached('a = ["x"]\nb = a + ["y"]')
         ev = Evaluator()
         ev.add_file_variables(f)
         result = ev.evaluate(ast.VariableRef(name="b"))
         self.assertIsInstance(result, ast.ListExpr)
-        strings = extract_string_list(result)
-        self.assertEqual(strings, ["x", "y"])
+        self.assertStringListEqual(result, ["x", "y"])
 
     def test_plus_assign(self):
-        f = parse_string('a = ["x"]\na += ["y"]')
+        f = parse_cached('a = ["x"]\na += ["y"]')
         ev = Evaluator()
         ev.add_file_variables(f)
         result = ev.evaluate(ast.VariableRef(name="a"))
-        strings = extract_string_list(result)
-        self.assertEqual(strings, ["x", "y"])
+        self.assertStringListEqual(result, ["x", "y"])
 
     def test_chained_variable_refs(self):
-        f = parse_string('''
+        f = parse_cached('''
             base = ["-O2"]
             extended = base + ["-Wall"]
         ''')
         ev = Evaluator()
         ev.add_file_variables(f)
         result = ev.evaluate(ast.VariableRef(name="extended"))
-        strings = extract_string_list(result)
-        self.assertEqual(strings, ["-O2", "-Wall"])
+        self.assertStringListEqual(result, ["-O2", "-Wall"])
 
 
-class TestDefaultsResolver(unittest.TestCase):
+class TestDefaultsResolver(StringListAssertions, unittest.TestCase):
 
     def test_simple_defaults(self):
-        f = parse_string('''
+        f = parse_cached('''
             cc_defaults {
                 name: "my_defaults",
                 cflags: ["-Wall"],
@@ -66,9 +64,7 @@ class TestDefaultsResolver(unittest.TestCase):
                 srcs: ["b.c"],
             }
         ''')
-        ev = Evaluator()
-        ev.add_file_variables(f)
-        modules = [ev.evaluate_module(m) for m in f.modules]
+        modules = Evaluator().evaluate_file(f)
 
         dr = DefaultsResolver()
         dr.register_defaults(modules)
@@ -77,15 +73,13 @@ class TestDefaultsResolver(unittest.TestCase):
         resolved = dr.resolve(mylib)
 
         self.assertEqual(resolved.name, "mylib")
-        cflags = extract_string_list(resolved.get("cflags"))
-        self.assertEqual(cflags, ["-Wall"])
+        self.assertStringListEqual(resolved.get("cflags"), ["-Wall"])
 
         # srcs should be concatenated: defaults + module
-        srcs = extract_string_list(resolved.get("srcs"))
-        self.assertEqual(srcs, ["a.c", "b.c"])
+        self.assertStringListEqual(resolved.get("srcs"), ["a.c", "b.c"])
 
     def test_chained_defaults(self):
-        f = parse_string('''
+        f = parse_cached('''
             cc_defaults {
                 name: "base_defaults",
                 cflags: ["-O2"],
@@ -100,9 +94,7 @@ class TestDefaultsResolver(unittest.TestCase):
                 defaults: ["extra_defaults"],
             }
         ''')
-        ev = Evaluator()
-        ev.add_file_variables(f)
-        modules = [ev.evaluate_module(m) for m in f.modules]
+        modules = Evaluator().evaluate_file(f)
 
         dr = DefaultsResolver()
         dr.register_defaults(modules)
@@ -110,12 +102,11 @@ class TestDefaultsResolver(unittest.TestCase):
         mylib = modules[2]
         resolved = dr.resolve(mylib)
 
-        cflags = extract_string_list(resolved.get("cflags"))
         # base_defaults then extra_defaults -> concat
-        self.assertEqual(cflags, ["-O2", "-Wall"])
+        self.assertStringListEqual(resolved.get("cflags"), ["-O2", "-Wall"])
 
     def test_map_merge(self):
-        f = parse_string('''
+        f = parse_cached('''
             cc_defaults {
                 name: "my_defaults",
                 arch: {
@@ -134,9 +125,7 @@ class TestDefaultsResolver(unittest.TestCase):
                 },
             }
         ''')
-        ev = Evaluator()
-        ev.add_file_variables(f)
-        modules = [ev.evaluate_module(m) for m in f.modules]
+        modules = Evaluator().evaluate_file(f)
 
         dr = DefaultsResolver()
         dr.register_defaults(modules)
@@ -153,42 +142,36 @@ class TestDefaultsResolver(unittest.TestCase):
         self.assertIsNotNone(x86, "x86 arch should be present from module")
 
 
-class TestDefaultsResolverRealFiles(unittest.TestCase):
-    """Tests against real Android.bp files."""
+class TestDefaultsResolverRealFiles(AospTestCase):
+    """Tests against real Android.bp files.
 
-    AOSP_ROOT = "/home/vgrade/AAOS-RE/aosp"
+    The parse -> evaluate -> register_defaults pipeline is O(modules)
+    and identical for every test here, so it runs once in setUpClass;
+    individual tests just resolve the module they care about.
+    """
 
-    def _skip_if_no_aosp(self):
-        if not os.path.isdir(self.AOSP_ROOT):
-            self.skipTest("AOSP tree not available")
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        f = load_bp(os.path.join(cls.AOSP_ROOT, "external/zlib/Android.bp"))
+        cls.modules = Evaluator().evaluate_file(f)
+        cls.modules_by_name = {m.name: m for m in cls.modules if m.name}
+        cls.dr = DefaultsResolver()
+        cls.dr.register_defaults(cls.modules)
 
     def test_zlib_defaults_resolution(self):
         """Test that zlib's cc_defaults chain resolves correctly."""
-        self._skip_if_no_aosp()
-        from bp2bst.parser import parse_file
-
-        f = parse_file(os.path.join(self.AOSP_ROOT, "external/zlib/Android.bp"))
-        ev = Evaluator()
-        ev.add_file_variables(f)
-        modules = [ev.evaluate_module(m) for m in f.modules]
-
-        dr = DefaultsResolver()
-        dr.register_defaults(modules)
-
-        # Find libz_static
-        libz_static = None
-        for m in modules:
-            if m.name == "libz_static":
-                libz_static = dr.resolve(m)
-                break
-        self.assertIsNotNone(libz_static)
+        self.assertIn("libz_static", self.modules_by_name)
+        libz_static = self.dr.resolve(self.modules_by_name["libz_static"])
         self.assertEqual(libz_static.name, "libz_static")
 
-        srcs = extract_string_list(libz_static.get("srcs"))
+        # Hoisted into sets: libz_static has dozens of srcs/cflags and
+        # each assertIn against the list would rescan it
+        srcs = set(extract_string_list(libz_static.get("srcs")))
         self.assertIn("adler32.c", srcs)
         self.assertIn("deflate.c", srcs)
 
-        cflags = extract_string_list(libz_static.get("cflags"))
+        cflags = set(extract_string_list(libz_static.get("cflags")))
         self.assertIn("-DHAVE_HIDDEN", cflags)
 
 